@@ -24,18 +24,26 @@ sys.path.insert(0, str(Path(__file__).resolve().parent))
 from resolve_doc_structure import find_project_root
 
 
-# スキップするディレクトリ
-SKIP_DIRS = {
+# スキップするディレクトリ（走査中に何度も照合するため、不変の frozenset で持つ）
+SKIP_DIRS = frozenset({
     '.git', '.claude', '.github', '.vscode', '.idea',
     'node_modules', '__pycache__', '.tox', '.mypy_cache',
     'venv', '.venv', 'env', '.env',
     'dist', 'build', 'target', 'out',
     '.next', '.nuxt', '.svelte-kit',
     'vendor', 'Pods', '.gradle',
-}
+})
 
 # これらのファイルが存在するディレクトリはソースコードディレクトリと判断しスキップ
-SKIP_INDICATORS = {'package.json', 'Cargo.toml', 'go.mod', 'pom.xml', 'setup.py', 'pyproject.toml'}
+SKIP_INDICATORS = frozenset({
+    'package.json', 'Cargo.toml', 'go.mod', 'pom.xml', 'setup.py', 'pyproject.toml',
+})
+
+# README 相当とみなすファイル名（小文字で比較）
+README_LIKE_NAMES = frozenset({
+    'readme.md', 'changelog.md', 'contributing.md', 'license.md',
+    'code_of_conduct.md', 'security.md',
+})
 
 
 def parse_args():
@@ -61,13 +69,14 @@ def find_md_dirs(project_root):
         list of (relative_dir_path, md_file_count)
     """
     results = []
-    root = Path(project_root)
+    # os.walk が返す dirpath は文字列なので、Path を組み立てず文字列のまま扱う
+    root = str(Path(project_root))
+    root_prefix = os.path.join(root, '')
     found_dirs = set()
     visited_real = set()  # 循環検出用（realpath で追跡）
 
     for dirpath, dirnames, filenames in os.walk(root, followlinks=True):
-        current = Path(dirpath)
-        real_path = current.resolve()
+        real_path = os.path.realpath(dirpath)
 
         # シンボリックリンクの循環検出
         if real_path in visited_real:
@@ -75,8 +84,12 @@ def find_md_dirs(project_root):
             continue
         visited_real.add(real_path)
 
-        rel = current.relative_to(root)
-        rel_str = str(rel)
+        rel_str = '.' if dirpath == root else dirpath[len(root_prefix):]
+
+        # ソースコードディレクトリ判定は走査済みのエントリ名で行う（追加 stat 不要）
+        is_source_dir = not (
+            SKIP_INDICATORS.isdisjoint(filenames) and SKIP_INDICATORS.isdisjoint(dirnames)
+        )
 
         # システムディレクトリ・隠しディレクトリを除外
         dirnames[:] = [
@@ -90,12 +103,12 @@ def find_md_dirs(project_root):
             continue
 
         # 祖先ディレクトリで既に .md が見つかっている場合はスキップ
-        if any(rel_str.startswith(found + '/') or rel_str == found for found in found_dirs):
+        if _has_found_ancestor(rel_str, found_dirs):
             dirnames[:] = []
             continue
 
         # ソースコードディレクトリはスキップ（配下の探索も停止）
-        if any((current / ind).exists() for ind in SKIP_INDICATORS):
+        if is_source_dir:
             dirnames[:] = []
             continue
 
@@ -109,14 +122,42 @@ def find_md_dirs(project_root):
     return results
 
 
-def is_readme_only(project_root, dir_path):
-    """README/CHANGELOG 等のみを含むディレクトリか判定する。"""
-    root = Path(project_root)
-    dir_full = root / dir_path
-    md_files = [f.name.lower() for f in dir_full.glob('*.md')]
-    skip_names = {'readme.md', 'changelog.md', 'contributing.md', 'license.md',
-                  'code_of_conduct.md', 'security.md'}
-    return bool(md_files) and all(f in skip_names for f in md_files)
+def _has_found_ancestor(rel_str, found_dirs):
+    """rel_str 自身またはその祖先ディレクトリが found_dirs に含まれるか判定する。
+
+    found_dirs を総当たりせず、rel_str の接頭辞（深さ分）を集合で引く。
+    発見済みディレクトリ数に依存せず、パスの深さに比例する回数で判定できる。
+    """
+    idx = len(rel_str)
+    while idx > 0:
+        if rel_str[:idx] in found_dirs:
+            return True
+        idx = rel_str.rfind('/', 0, idx)
+    return False
+
+
+def _list_md_entries(dir_full):
+    """ディレクトリ直下の .md エントリを 1 回の scandir で列挙する。
+
+    Returns:
+        list of (name, path)。ディレクトリを読めない場合は空リスト
+    """
+    try:
+        with os.scandir(dir_full) as it:
+            return [(e.name, e.path) for e in it if e.name.endswith('.md')]
+    except OSError:
+        return []
+
+
+def is_readme_only(project_root, dir_path, md_names=None):
+    """README/CHANGELOG 等のみを含むディレクトリか判定する。
+
+    md_names を渡した場合はディレクトリを再走査せずその一覧で判定する。
+    """
+    if md_names is None:
+        md_names = [name for name, _ in _list_md_entries(os.path.join(project_root, dir_path))]
+    md_files = [name.lower() for name in md_names]
+    return bool(md_files) and all(f in README_LIKE_NAMES for f in md_files)
 
 
 def extract_front_matter(filepath):
@@ -172,14 +213,14 @@ def scan_directories(project_root, skip_prefixes=None):
         )]
 
     results = []
-    root = Path(project_root)
 
     for dir_path, md_count in md_dirs:
-        dir_full = root / dir_path
+        # frontmatter 収集と README 判定で同じ一覧を共有し、走査を 1 回に抑える
+        md_entries = _list_md_entries(os.path.join(project_root, dir_path))
 
         # frontmatter の doc_type 値を収集（生データ）
         doc_type_values = []
-        for md_file in dir_full.glob('*.md'):
+        for _, md_file in md_entries:
             fm = extract_front_matter(md_file)
             if fm and 'doc_type' in fm:
                 doc_type_values.append(fm['doc_type'].lower())
@@ -187,7 +228,9 @@ def scan_directories(project_root, skip_prefixes=None):
         results.append({
             'dir': dir_path,
             'md_count': md_count,
-            'readme_only': is_readme_only(project_root, dir_path),
+            'readme_only': is_readme_only(
+                project_root, dir_path, [name for name, _ in md_entries]
+            ),
             'path_components': list(Path(dir_path).parts),
             'frontmatter_doc_types': doc_type_values or None,
         })
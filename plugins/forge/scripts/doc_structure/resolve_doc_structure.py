@@ -17,8 +17,6 @@ doc-advisor の toc_utils.py 互換ロジックで実装。
 """
 
 import argparse
-import fnmatch
-import glob as glob_module
 import json
 import os
 import re
@@ -33,6 +31,11 @@ from pathlib import Path
 
 VERSION_MARKER = 'doc_structure_version:'
 
+# マーカー以降の同一行の値（前後の空白を除く）を捕捉する。値が空の行は読み飛ばす
+_VERSION_RE = re.compile(
+    re.escape(VERSION_MARKER) + r'[^\S\n]*(\S[^\n]*?)[^\S\n]*$', re.MULTILINE
+)
+
 
 def get_version(content):
     """.doc_structure.yaml からバージョン文字列を取得する。
@@ -45,14 +48,9 @@ def get_version(content):
     Returns:
         str | None: バージョン文字列（例: "2.0"）。見つからなければ None
     """
-    for line in content.split('\n'):
-        stripped = line.strip()
-        if VERSION_MARKER in stripped:
-            _, _, version_str = stripped.partition(VERSION_MARKER)
-            version_str = version_str.strip()
-            if version_str:
-                return version_str
-    return None
+    # 行分割せず、内容全体に対する 1 回の正規表現検索で最初の値を取り出す
+    match = _VERSION_RE.search(content)
+    return match.group(1) if match else None
 
 
 def get_major_version(content):
@@ -64,7 +62,11 @@ def get_major_version(content):
     Returns:
         int | None: メジャーバージョン（例: 4）。取得失敗時は None
     """
-    version = get_version(content)
+    return _major_of(get_version(content))
+
+
+def _major_of(version):
+    """バージョン文字列（例: "3.0"）からメジャー番号を取り出す。取得失敗時は None。"""
     if version:
         try:
             return int(version.split('.')[0])
@@ -139,13 +141,15 @@ def parse_config(content):
     lines = content.split('\n')
 
     for i, line in enumerate(lines):
-        stripped = line.strip()
+        # lstrip は 1 回だけ行い、インデント算出と内容判定で共有する
+        lstripped = line.lstrip()
 
         # コメント・空行をスキップ
-        if not stripped or stripped.startswith('#'):
+        if not lstripped or lstripped[0] == '#':
             continue
 
-        indent = len(line) - len(line.lstrip())
+        stripped = lstripped.rstrip()
+        indent = len(line) - len(lstripped)
 
         if ':' in stripped and not stripped.startswith('- '):
             key, _, value = stripped.partition(':')
@@ -218,12 +222,13 @@ def _lookahead_is_list(lines, start_idx, parent_indent=4):
     """
     for i in range(start_idx, min(start_idx + 10, len(lines))):
         line = lines[i]
-        stripped = line.strip()
+        lstripped = line.lstrip()
 
-        if not stripped or stripped.startswith('#'):
+        if not lstripped or lstripped[0] == '#':
             continue
 
-        indent = len(line) - len(line.lstrip())
+        stripped = lstripped.rstrip()
+        indent = len(line) - len(lstripped)
         if indent <= parent_indent:
             break
 
@@ -265,6 +270,31 @@ def _parse_value(value):
     return value
 
 
+# ---------------------------------------------------------------------------
+# 相対パス変換
+# ---------------------------------------------------------------------------
+
+def _root_prefix(root):
+    """root 配下の絶対パスから相対パスを切り出すための接頭辞を返す。
+
+    Path.relative_to() は結果ごとに PurePath を 2 つ組み立てるため、大量の
+    glob / 走査結果を変換する箇所では文字列の接頭辞比較とスライスで代替する。
+    root は Path で正規化済みであること（Path 由来の結果と表記を揃えるため）。
+    """
+    root_str = str(root)
+    if root_str == os.curdir:
+        return ''
+    return os.path.join(root_str, '')
+
+
+def _relative_to_root(path_str, root, root_prefix):
+    """path_str を root からの相対パス文字列にする（_root_prefix() と併用）。"""
+    if path_str.startswith(root_prefix):
+        return path_str[len(root_prefix):]
+    # 接頭辞が一致しない表記（想定外）は従来どおり Path で変換する
+    return str(Path(path_str).relative_to(root))
+
+
 # ---------------------------------------------------------------------------
 # glob 展開
 # ---------------------------------------------------------------------------
@@ -283,6 +313,7 @@ def expand_globs(dirs, project_root):
     """
     expanded = []
     root = Path(project_root)
+    root_prefix = _root_prefix(root)
 
     for dir_path in dirs:
         if '*' in dir_path or '?' in dir_path:
@@ -290,7 +321,7 @@ def expand_globs(dirs, project_root):
             matches = sorted(root.glob(pattern))
             for match in matches:
                 if match.is_dir():
-                    rel = str(match.relative_to(root))
+                    rel = _relative_to_root(str(match), root, root_prefix)
                     expanded.append(rel + '/')
         else:
             expanded.append(dir_path)
@@ -319,20 +350,54 @@ def is_excluded(filepath, root_dir, exclude_patterns):
     if not exclude_patterns:
         return False
 
-    rel_path = normalize_path(filepath.relative_to(root_dir))
-    path_parts = rel_path.split('/')
-    dir_parts = path_parts[:-1]  # ファイル名を除く
-    dir_path = '/'.join(dir_parts)
+    return _is_excluded_rel(
+        normalize_path(filepath.relative_to(root_dir)),
+        _compile_exclude_patterns(exclude_patterns),
+    )
+
 
-    for pattern in exclude_patterns:
+def _compile_exclude_patterns(exclude_patterns):
+    """exclude パターンを判定用に前処理する。
+
+    パターンの NFC 正規化と種別判定はファイルごとではなく収集 1 回につき
+    1 度だけ行えばよいため、is_excluded の前段として分離した。
+
+    Args:
+        exclude_patterns: 除外パターンのリスト
+
+    Returns:
+        tuple: (パス形式パターンのタプル, ディレクトリ名パターンの frozenset)
+    """
+    path_patterns = []
+    name_patterns = set()
+    for pattern in exclude_patterns or ():
         normalized = normalize_path(pattern.strip('/'))
         if '/' in normalized:
-            if normalized in dir_path:
-                return True
+            path_patterns.append(normalized)
         else:
-            if normalized in dir_parts:
-                return True
-    return False
+            name_patterns.add(normalized)
+    return tuple(path_patterns), frozenset(name_patterns)
+
+
+def _is_excluded_rel(rel_path, compiled):
+    """NFC 正規化済みの相対パスを _compile_exclude_patterns() の結果で判定する。"""
+    return _is_excluded_dir(rel_path.rpartition('/')[0], compiled)  # ファイル名を除く
+
+
+def _is_excluded_dir(dir_path, compiled):
+    """NFC 正規化済みの相対ディレクトリパスが除外対象か判定する。
+
+    判定はディレクトリ部分だけで決まり、除外されたディレクトリの配下も必ず
+    除外される（祖先の成分・部分文字列をそのまま含むため）。走査側はこの
+    性質を使い、除外ディレクトリの部分木ごと探索を打ち切れる。
+    """
+    path_patterns, name_patterns = compiled
+    if not dir_path or (not path_patterns and not name_patterns):
+        return False
+
+    if name_patterns and not name_patterns.isdisjoint(dir_path.split('/')):
+        return True
+    return any(pattern in dir_path for pattern in path_patterns)
 
 
 # ---------------------------------------------------------------------------
@@ -350,26 +415,72 @@ def collect_md_files(directory, exclude_patterns, project_root):
     Returns:
         list[str]: project_root からの相対パス
     """
+    if not os.path.isdir(directory):
+        return []
+
+    # 走査起点を Path で正規化し、root_prefix と同じ表記で相対化する
     root = Path(project_root)
-    dir_path = Path(directory)
+    start = str(Path(directory))
+    start_rel = _relative_to_root(start, root, _root_prefix(root))
+    if start_rel == os.curdir:
+        start_rel = ''
+
+    result = list(_walk_md_files(
+        start, start_rel, _compile_exclude_patterns(exclude_patterns)
+    ))
+    result.sort()
+    return result
 
-    if not dir_path.is_dir():
-        return []
 
-    pattern = os.path.join(str(dir_path), '**', '*.md')
-    md_files = glob_module.glob(pattern, recursive=True)
+def _walk_md_files(directory, rel_dir, excluded):
+    """directory 配下の .md ファイルを 1 回の走査で列挙する。
 
-    result = []
-    for f in sorted(md_files):
-        fp = Path(f)
-        if not fp.is_file():
+    `glob('**/*.md', recursive=True)` と同じく隠しファイル・隠しディレクトリは
+    対象外とし、ディレクトリへの symlink は辿る。種別判定は `os.scandir` の
+    DirEntry が持つ情報を使い、ファイルごとの追加 stat を発生させない。
+    symlink 経由で祖先ディレクトリ（走査起点を含む）の実体へ戻る循環だけを
+    打ち切る。同じ実体を指す別名（複数の symlink）は glob と同様にそれぞれ辿る。
+
+    Args:
+        directory: 走査起点の絶対パス
+        rel_dir: directory の project_root からの相対パス（ルート自身なら空文字）
+        excluded: _compile_exclude_patterns() の戻り値
+
+    Yields:
+        str: project_root からの相対パス（走査順。ソートは呼び出し側で行う）
+    """
+    start_real = os.path.realpath(directory)
+    # 各要素: (パス, 相対パス, 実体パス, 祖先（自身を含む）の実体パス集合)
+    stack = [(directory, rel_dir, start_real, frozenset((start_real,)))]
+    while stack:
+        current, current_rel, current_real, ancestors = stack.pop()
+        # exclude はディレクトリ単位で決まるため、除外ディレクトリは部分木ごと飛ばす
+        if _is_excluded_dir(normalize_path(current_rel), excluded):
             continue
-        if is_excluded(fp, root, exclude_patterns):
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
             continue
-        rel = str(fp.relative_to(root))
-        result.append(rel)
-
-    return result
+        for entry in entries:
+            name = entry.name
+            if name.startswith('.'):
+                continue
+            rel = f'{current_rel}/{name}' if current_rel else name
+            try:
+                if entry.is_dir():
+                    if entry.is_symlink():
+                        real = os.path.realpath(entry.path)
+                        if real in ancestors:
+                            continue
+                    else:
+                        # symlink でない子の実体は親の実体直下なので realpath 不要
+                        real = os.path.join(current_real, name)
+                    stack.append((entry.path, rel, real, ancestors | {real}))
+                elif name.endswith('.md') and entry.is_file():
+                    yield rel
+            except OSError:
+                continue
 
 
 # ---------------------------------------------------------------------------
@@ -413,11 +524,12 @@ def match_path_to_doc_type(file_path, doc_types_map, project_root):
 
         if '*' in pattern_normalized or '?' in pattern_normalized:
             # glob パターン: 展開して照合
+            # どの展開先に一致しても返す doc_type は同じなので、展開順は問わない
             root = Path(project_root)
-            expanded = sorted(root.glob(pattern_normalized))
-            for expanded_dir in expanded:
+            root_prefix = _root_prefix(root)
+            for expanded_dir in root.glob(pattern_normalized):
                 if expanded_dir.is_dir():
-                    rel = normalize_path(str(expanded_dir.relative_to(root)))
+                    rel = normalize_path(_relative_to_root(str(expanded_dir), root, root_prefix))
                     if file_path.startswith(rel + '/') or file_path.startswith(rel + os.sep):
                         return doc_type
         else:
@@ -450,30 +562,28 @@ def detect_features(config, project_root):
     """
     features = set()
     root = Path(project_root)
+    root_prefix = _root_prefix(root)
 
     specs = config.get('specs', {})
     root_dirs = specs.get('root_dirs', [])
-    exclude_patterns = specs.get('patterns', {}).get('exclude', [])
+    excluded = _compile_exclude_patterns(specs.get('patterns', {}).get('exclude', []))
 
     for dir_pattern in root_dirs:
         if '*' not in dir_pattern:
             continue
 
         pattern = dir_pattern.rstrip('/')
-        matches = sorted(root.glob(pattern))
 
-        for match in matches:
+        # 結果は set に集めて最後に 1 度だけソートするため、マッチ単位では並べ替えない
+        for match in root.glob(pattern):
             if not match.is_dir():
                 continue
-            if is_excluded(
-                match / 'dummy.md',  # is_excluded はファイルパスを要求
-                root,
-                exclude_patterns,
-            ):
+
+            rel = _relative_to_root(str(match), root, root_prefix)
+            if _is_excluded_dir(normalize_path(rel), excluded):
                 continue
 
             # glob パターン中の * 位置から Feature 名を抽出
-            rel = str(match.relative_to(root))
             feature = _extract_feature_from_match(pattern, rel)
             if feature:
                 features.add(feature)
@@ -611,6 +721,17 @@ def load_doc_structure(project_root, doc_structure_path=None):
     Returns:
         tuple: (config_dict, raw_content)
 
+    Raises:
+        FileNotFoundError: ファイルが見つからない場合
+    """
+    content = _read_doc_structure_text(project_root, doc_structure_path)
+    config = parse_config(content)
+    return config, content
+
+
+def _read_doc_structure_text(project_root, doc_structure_path=None):
+    """.doc_structure.yaml の内容をパースせずに読み込む（--version はこれだけを使う）。
+
     Raises:
         FileNotFoundError: ファイルが見つからない場合
     """
@@ -623,10 +744,7 @@ def load_doc_structure(project_root, doc_structure_path=None):
         )
 
     with open(doc_structure_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    config = parse_config(content)
-    return config, content
+        return f.read()
 
 
 def resolve_files(config, category, project_root):
@@ -773,9 +891,13 @@ def main():
     if doc_structure_path:
         doc_structure_path = os.path.abspath(doc_structure_path)
 
-    # 読み込み
+    # 読み込み（--version はバージョン行を読むだけでよく、設定全体のパースは不要）
     try:
-        config, raw_content = load_doc_structure(project_root, doc_structure_path)
+        if args.version:
+            config = None
+            raw_content = _read_doc_structure_text(project_root, doc_structure_path)
+        else:
+            config, raw_content = load_doc_structure(project_root, doc_structure_path)
     except FileNotFoundError as e:
         print(json.dumps({'status': 'error', 'message': str(e)},
                          ensure_ascii=False))
@@ -788,7 +910,7 @@ def main():
         result = {
             'status': 'ok',
             'version': version,
-            'major_version': get_major_version(raw_content),
+            'major_version': _major_of(version),
         }
     else:
         # --type / --features / --doc-type はバリデーション必須
@@ -829,7 +951,9 @@ def main():
             if args.type in ('specs', 'all'):
                 result['specs'] = resolve_files(config, 'specs', project_root)
 
-    print(json.dumps(result, indent=2, ensure_ascii=False))
+    # --type all 等で大きくなり得るため、文字列全体を組み立てずストリームで書き出す
+    json.dump(result, sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write('\n')
     return 0
 
 
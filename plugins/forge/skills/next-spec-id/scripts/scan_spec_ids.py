@@ -14,6 +14,7 @@
 """
 
 import argparse
+import importlib.util
 import json
 import os
 import re
@@ -21,15 +22,20 @@ import subprocess
 import sys
 from pathlib import Path
 
-# resolve_doc_structure.py を import
+# resolve_doc_structure.py をファイルパスから直接ロードする。
+# sys.path への挿入は以降のすべての import の探索先を増やすため行わない
 _SCRIPT_DIR = Path(__file__).resolve().parent
-_DOC_STRUCTURE_SCRIPTS = _SCRIPT_DIR.parents[2] / 'scripts' / 'doc_structure'
-sys.path.insert(0, str(_DOC_STRUCTURE_SCRIPTS))
-
-from resolve_doc_structure import (
-    find_project_root,
-    load_doc_structure,
+_RESOLVER_SCRIPT = (
+    _SCRIPT_DIR.parents[2] / 'scripts' / 'doc_structure' / 'resolve_doc_structure.py'
+)
+_resolver_spec = importlib.util.spec_from_file_location(
+    'forge_doc_structure_resolver', str(_RESOLVER_SCRIPT)
 )
+_resolver = importlib.util.module_from_spec(_resolver_spec)
+_resolver_spec.loader.exec_module(_resolver)
+
+find_project_root = _resolver.find_project_root
+load_doc_structure = _resolver.load_doc_structure
 
 FALLBACK_SPECS_DIRS = ['specs/']
 
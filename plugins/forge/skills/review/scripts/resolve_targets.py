@@ -30,9 +30,11 @@ JSON を標準出力へ返す。標準ライブラリのみ使用する（`git`
 
 import argparse
 import json
+import os
 import re
 import subprocess
 import sys
+from collections.abc import Iterable
 from pathlib import Path
 
 DEFAULT_BASE_CANDIDATES = ["develop", "main", "master"]
@@ -69,8 +71,8 @@ def _read_configured_base_branch(project_root: Path) -> str | None:
     （このファイルで必要なのは単一のスカラー値のみのため）。
     """
     config_path = project_root / ".git_information.yaml"
-    if not config_path.is_file():
-        return None
+    # 事前の is_file() は呼ばない。不在・ディレクトリ・権限不足はいずれも
+    # 読み込み時の OSError として 1 回の open で判別できる
     try:
         text = config_path.read_text(encoding="utf-8")
     except OSError:
@@ -207,8 +209,7 @@ def get_branch_targets(project_root: Path, base_ref: str):
 
     combined = set(committed_files) | set(uncommitted_files)
     # 削除済みでワークツリーに存在しないファイルはレビュー（Read）できないため除外する
-    existing = [f for f in combined if (project_root / f).is_file()]
-    return sorted(existing)
+    return sorted(_existing_files(project_root, combined))
 
 
 def get_dir_targets(project_root: Path, dirs: list[str]):
@@ -228,8 +229,44 @@ def get_dir_targets(project_root: Path, dirs: list[str]):
 
     candidates = {entry for entry in stdout.split("\0") if entry}
     # 削除済みでワークツリーに存在しないファイルはレビュー（Read）できないため除外する
-    existing = [f for f in candidates if (project_root / f).is_file()]
-    return sorted(existing)
+    return sorted(_existing_files(project_root, candidates))
+
+
+def _existing_files(project_root: Path, candidates: Iterable[str]) -> list[str]:
+    """candidates（ルート相対パス）のうち、ファイルとして実在するものを返す。
+
+    git の出力は同じディレクトリのファイルが並ぶことが多いため、親ディレクトリ
+    ごとに `os.scandir` 1 回でまとめて判定し、ファイルごとの stat を避ける。
+    一覧に見つからない名前だけは個別に `is_file()` で確かめ直す（macOS の
+    NFC / NFD のように、git が出す名前とディレクトリエントリ名の表記が
+    食い違っても実在ファイルを落とさないため）。
+    """
+    by_parent: dict[str, list[tuple[str, str]]] = {}
+    for path in candidates:
+        parent, _, name = path.rpartition("/")
+        by_parent.setdefault(parent, []).append((path, name))
+
+    existing = []
+    for parent, members in by_parent.items():
+        if len(members) == 1:
+            path, _ = members[0]
+            if (project_root / path).is_file():
+                existing.append(path)
+            continue
+
+        # 候補以外のエントリは is_file()（シンボリックリンクでは stat）を呼ばずに捨てる
+        wanted = {name for _, name in members}
+        try:
+            with os.scandir(project_root / parent) as it:
+                file_names = {
+                    entry.name for entry in it if entry.name in wanted and entry.is_file()
+                }
+        except OSError:
+            file_names = set()
+        for path, name in members:
+            if name in file_names or (project_root / path).is_file():
+                existing.append(path)
+    return existing
 
 
 def _split_csv(raw: str | None) -> list[str]:
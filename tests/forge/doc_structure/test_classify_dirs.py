@@ -30,6 +30,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[3]
 from classify_dirs import (
     SKIP_DIRS,
     SKIP_INDICATORS,
+    _has_found_ancestor,
     extract_front_matter,
     is_readme_only,
     find_md_dirs,
@@ -110,6 +111,29 @@ class TestIsReadmeOnly(_FsTestCase):
         self._write_file('docs/readme.md', '# Readme')
         self.assertTrue(is_readme_only(str(self.tmpdir), 'docs'))
 
+    def test_md_names_given(self):
+        """md_names 指定時はディレクトリを走査せずその一覧で判定する"""
+        self._write_file('docs/guide.md', '# Guide')
+        self.assertTrue(is_readme_only(str(self.tmpdir), 'docs', ['README.md']))
+        self.assertFalse(is_readme_only(str(self.tmpdir), 'docs', []))
+
+
+class TestHasFoundAncestor(unittest.TestCase):
+    """_has_found_ancestor のテスト"""
+
+    def test_self_and_ancestor(self):
+        found = {'docs', 'specs/forge'}
+        self.assertTrue(_has_found_ancestor('docs', found))
+        self.assertTrue(_has_found_ancestor('docs/sub/deep', found))
+        self.assertTrue(_has_found_ancestor('specs/forge/design', found))
+
+    def test_sibling_with_shared_prefix_not_matched(self):
+        """'docs' の発見は 'docs2' や 'specs/forge-x' を塞がない"""
+        found = {'docs', 'specs/forge'}
+        self.assertFalse(_has_found_ancestor('docs2', found))
+        self.assertFalse(_has_found_ancestor('specs/forge-x/design', found))
+        self.assertFalse(_has_found_ancestor('specs', found))
+
 
 class TestFindMdDirs(_FsTestCase):
     """find_md_dirs のテスト"""
@@ -141,6 +165,16 @@ class TestFindMdDirs(_FsTestCase):
         dirs = [d for d, _ in result]
         self.assertNotIn('frontend', dirs)
 
+    def test_skip_project_indicator_directory(self):
+        """SKIP_INDICATORS と同名のディレクトリがあっても除外（存在判定はエントリ名で行う）"""
+        (self.tmpdir / 'crate' / 'Cargo.toml').mkdir(parents=True)
+        self._write_file('crate/README.md', '# Crate')
+        self._write_file('docs/guide.md', '# Guide')
+        result = find_md_dirs(str(self.tmpdir))
+        dirs = [d for d, _ in result]
+        self.assertNotIn('crate', dirs)
+        self.assertIn('docs', dirs)
+
     def test_root_not_included(self):
         """ルートディレクトリ自体は含まれない"""
         self._write_file('README.md', '# Root')
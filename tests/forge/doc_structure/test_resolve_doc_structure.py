@@ -201,6 +201,15 @@ class TestGetVersion(unittest.TestCase):
         self.assertEqual(rds.get_version(content), '3.1')
         self.assertEqual(rds.get_major_version(content), 3)
 
+    def test_get_version_skips_empty_marker(self):
+        """値が空のマーカー行は読み飛ばし、次の行の値を採用する"""
+        content = '# doc_structure_version:\n# doc_structure_version: 2.1  \r\nrules:\n'
+        self.assertEqual(rds.get_version(content), '2.1')
+
+    def test_get_version_value_does_not_span_lines(self):
+        content = '# doc_structure_version:   \n\nrules:\n'
+        self.assertIsNone(rds.get_version(content))
+
 
 class TestNormalizePath(unittest.TestCase):
     """パス正規化のテスト"""
@@ -446,6 +455,89 @@ class TestCollectMdFiles(unittest.TestCase):
             )
             self.assertEqual(len(result), 3)
 
+    def test_collect_skips_hidden(self):
+        """glob と同様に隠しファイル・隠しディレクトリは収集しない"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            create_test_project(tmpdir, [
+                'docs/rules/a.md',
+                'docs/rules/.hidden.md',
+                'docs/rules/.cache/b.md',
+            ])
+            result = rds.collect_md_files(
+                os.path.join(tmpdir, 'docs/rules'), [], tmpdir
+            )
+            self.assertEqual(result, ['docs/rules/a.md'])
+
+    def test_collect_sorted(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            create_test_project(tmpdir, [
+                'docs/rules/z.md',
+                'docs/rules/sub/b.md',
+                'docs/rules/a.md',
+            ])
+            result = rds.collect_md_files(
+                os.path.join(tmpdir, 'docs/rules'), [], tmpdir
+            )
+            self.assertEqual(result, [
+                'docs/rules/a.md',
+                'docs/rules/sub/b.md',
+                'docs/rules/z.md',
+            ])
+
+    def test_collect_exclude_applies_to_nested_dirs(self):
+        """除外ディレクトリ配下の深い階層も収集しない"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            create_test_project(tmpdir, [
+                'docs/rules/a.md',
+                'docs/rules/archived/b.md',
+                'docs/rules/archived/deep/c.md',
+                'docs/rules/old/archive/d.md',
+            ])
+            result = rds.collect_md_files(
+                os.path.join(tmpdir, 'docs/rules'), ['archived', 'old/archive'], tmpdir
+            )
+            self.assertEqual(result, ['docs/rules/a.md'])
+
+    def test_collect_from_project_root(self):
+        """project_root 自体を起点にしても相対パスに './' が付かない"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            create_test_project(tmpdir, ['README.md', 'docs/a.md'])
+            result = rds.collect_md_files(tmpdir, [], tmpdir)
+            self.assertEqual(result, ['README.md', 'docs/a.md'])
+
+    def test_collect_symlink_loop_terminates(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            create_test_project(tmpdir, ['docs/rules/a.md'])
+            os.symlink(
+                os.path.join(tmpdir, 'docs', 'rules'),
+                os.path.join(tmpdir, 'docs', 'rules', 'loop'),
+            )
+            result = rds.collect_md_files(
+                os.path.join(tmpdir, 'docs/rules'), [], tmpdir
+            )
+            self.assertEqual(result, ['docs/rules/a.md'])
+
+    def test_collect_symlink_aliases_all_followed(self):
+        """同じ実体を指す複数の symlink はそれぞれ辿る（glob と同じ）"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            create_test_project(tmpdir, [
+                'docs/rules/a.md',
+                'docs/rules/real/r.md',
+                'ext/e.md',
+            ])
+            rules = os.path.join(tmpdir, 'docs', 'rules')
+            os.symlink(os.path.join('..', '..', 'ext'), os.path.join(rules, 'l1'))
+            os.symlink(os.path.join('..', '..', 'ext'), os.path.join(rules, 'l2'))
+            os.symlink('real', os.path.join(rules, 'aliasreal'))
+            result = rds.collect_md_files(rules, [], tmpdir)
+            self.assertEqual(result, [
+                'docs/rules/a.md',
+                'docs/rules/aliasreal/r.md',
+                'docs/rules/l1/e.md',
+                'docs/rules/l2/e.md',
+                'docs/rules/real/r.md',
+            ])
+
 
 class TestInvertDocTypesMap(unittest.TestCase):
     """doc_types_map 逆引きのテスト"""
@@ -752,6 +844,22 @@ class TestLoadDocStructure(unittest.TestCase):
             config, _ = rds.load_doc_structure(tmpdir, custom)
             self.assertIn('rules', config)
 
+    def test_load_directory_is_not_found(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.makedirs(os.path.join(tmpdir, '.doc_structure.yaml'))
+            with self.assertRaises(FileNotFoundError):
+                rds.load_doc_structure(tmpdir)
+
+    def test_load_parent_is_file_is_not_found(self):
+        """親パス成分がファイルでも NotADirectoryError ではなく FileNotFoundError"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            notdir = os.path.join(tmpdir, 'notdir')
+            open(notdir, 'w').close()
+            with self.assertRaises(FileNotFoundError):
+                rds.load_doc_structure(
+                    tmpdir, os.path.join(notdir, '.doc_structure.yaml')
+                )
+
 
 class TestFindProjectRoot(unittest.TestCase):
     """プロジェクトルート検出のテスト"""
@@ -915,6 +1023,30 @@ class TestValidateDocStructure(unittest.TestCase):
             self.assertEqual(data['status'], 'error')
             self.assertIn('suggestion', data)
 
+    def test_cli_version_skips_validation(self):
+        """--version は旧フォーマットでもバリデーションせずバージョンを返す"""
+        import subprocess
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ds_path = os.path.join(tmpdir, '.doc_structure.yaml')
+            with open(ds_path, 'w') as f:
+                f.write(V1_CONFIG)
+
+            script = os.path.join(
+                os.path.dirname(__file__), '..', '..', '..', 'plugins',
+                'forge', 'scripts', 'doc_structure',
+                'resolve_doc_structure.py'
+            )
+            proc = subprocess.run(
+                [sys.executable, script, '--version',
+                 '--project-root', tmpdir],
+                capture_output=True, text=True,
+            )
+            self.assertEqual(proc.returncode, 0)
+            data = json.loads(proc.stdout)
+            self.assertEqual(data['status'], 'ok')
+            self.assertEqual(data['version'], rds.get_version(V1_CONFIG))
+            self.assertEqual(data['major_version'], rds.get_major_version(V1_CONFIG))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -10,11 +10,14 @@ importlib 直接ロード・一時ディレクトリ実ファイル作成方式
   python3 -m unittest tests.forge.review.test_resolve_targets -v
 """
 
+import contextlib
 import importlib.util
 import io
 import json
+import os
 import subprocess
 import tempfile
+import unicodedata
 import unittest
 from pathlib import Path
 from unittest import mock
@@ -186,6 +189,18 @@ class BranchModeResolutionTest(unittest.TestCase):
         self.assertEqual(base_branch, "custom-base")
         self.assertEqual(base_ref, "custom-base")
 
+    def test_git_information_directory_is_ignored(self):
+        """`.git_information.yaml` がディレクトリなら設定なしとして既定候補へ進む。"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+            (project_root / ".git_information.yaml").mkdir()
+
+            self.assertIsNone(resolve_targets_mod._read_configured_base_branch(project_root))
+
+    def test_git_information_missing_is_none(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.assertIsNone(resolve_targets_mod._read_configured_base_branch(Path(tmpdir)))
+
     def test_develop_takes_priority_over_main_and_master(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             project_root = Path(tmpdir)
@@ -608,6 +623,71 @@ class DirsModeTest(unittest.TestCase):
         self.assertEqual(result["status"], "error")
 
 
+class ExistingFilesTest(unittest.TestCase):
+    """`_existing_files` は親ディレクトリ単位でまとめて実在判定する。"""
+
+    def test_keeps_only_regular_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+            _write(project_root, "docs/a.md")
+            _write(project_root, "docs/b.md")
+            _write(project_root, "top.txt")
+            (project_root / "docs" / "sub").mkdir()
+
+            result = resolve_targets_mod._existing_files(
+                project_root,
+                ["docs/a.md", "docs/b.md", "docs/gone.md", "docs/sub", "top.txt", "missing/x.md"],
+            )
+
+        self.assertEqual(sorted(result), ["docs/a.md", "docs/b.md", "top.txt"])
+
+    def test_falls_back_to_is_file_when_entry_name_differs(self):
+        """ディレクトリ一覧に名前が無くても実在すれば採用する（NFC / NFD 差異の救済）。"""
+        nfc_name = unicodedata.normalize("NFC", "が.md")
+        real_scandir = os.scandir
+
+        class _NfdEntry:
+            """macOS のように一覧上の名前だけが NFD になるエントリを模す。"""
+
+            def __init__(self, entry):
+                self._entry = entry
+                self.name = unicodedata.normalize("NFD", entry.name)
+
+            def is_file(self):
+                return self._entry.is_file()
+
+        @contextlib.contextmanager
+        def nfd_scandir(path):
+            with real_scandir(path) as it:
+                yield [_NfdEntry(entry) for entry in it]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+            _write(project_root, f"docs/{nfc_name}")
+            _write(project_root, "docs/b.md")
+
+            with mock.patch.object(resolve_targets_mod.os, "scandir", side_effect=nfd_scandir):
+                result = resolve_targets_mod._existing_files(
+                    project_root, [f"docs/{nfc_name}", "docs/b.md", "docs/gone.md"]
+                )
+
+        self.assertEqual(sorted(result), sorted([f"docs/{nfc_name}", "docs/b.md"]))
+
+    def test_falls_back_to_is_file_when_scandir_fails(self):
+        """親ディレクトリの一覧取得に失敗しても個別の is_file() で判定する。"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+            _write(project_root, "docs/a.md")
+            _write(project_root, "docs/b.md")
+
+            with mock.patch.object(resolve_targets_mod.os, "scandir", side_effect=OSError):
+                result = resolve_targets_mod._existing_files(
+                    project_root, ["docs/a.md", "docs/b.md", "docs/gone.md"]
+                )
+
+        self.assertEqual(sorted(result), ["docs/a.md", "docs/b.md"])
+
+
 class OutputSchemaTest(unittest.TestCase):
     """全モード共通の出力スキーマ（status/mode/base_branch/files/dirs/warnings）を検証する。
 